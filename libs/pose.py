@@ -1,8 +1,10 @@
+import sys
+
 from maya.api import OpenMaya as om
 from mpy import mpyscene, mpynode
-from copy import copy, deepcopy
-from operator import neg
-from itertools import chain
+from copy import copy
+from operator import attrgetter
+from bisect import bisect_left, bisect_right
 from dcc.json import psonobject
 from dcc.python import stringutils
 from dcc.dataclasses import keyframe
@@ -32,7 +34,9 @@ class Pose(melsonobject.MELSONObject):
         '_animationRange',
         '_nodes',
         '_animLayers',
-        '_thumbnail'
+        '_thumbnail',
+        '_nodesByName',
+        '_nodesByNameLower'
     )
 
     def __init__(self, *args, **kwargs):
@@ -55,6 +59,8 @@ class Pose(melsonobject.MELSONObject):
         self._nodes = notifylist.NotifyList()
         self._animLayers = notifylist.NotifyList()
         self._thumbnail = None
+        self._nodesByName = {}
+        self._nodesByNameLower = {}
 
         # Initialize notifies
         #
@@ -63,6 +69,48 @@ class Pose(melsonobject.MELSONObject):
 
         self._animLayers.addCallback('itemAdded', self.animLayerAdded)
         self._animLayers.addCallback('itemRemoved', self.animLayerRemoved)
+
+    def __copy__(self):
+        """
+        Private method that returns a copy of this pose.
+        Anim layers are shared with this pose rather than reparented to the copy!
+
+        :rtype: Pose
+        """
+
+        # Create new instance without querying the scene
+        #
+        cls = self.__class__
+        instance = cls.__new__(cls)
+
+        instance._scene = self._scene
+        instance._name = self._name
+        instance._filePath = self._filePath
+        instance._animationRange = self._animationRange
+        instance._nodes = notifylist.NotifyList()
+        instance._animLayers = notifylist.NotifyList()
+        instance._thumbnail = self._thumbnail
+        instance._nodesByName = {}
+        instance._nodesByNameLower = {}
+
+        # Share anim layers before the callbacks are registered
+        # This keeps the layers parented to this pose!
+        #
+        instance._animLayers.extend(self._animLayers)
+
+        # Initialize notifies
+        #
+        instance._nodes.addCallback('itemAdded', instance.nodeAdded)
+        instance._nodes.addCallback('itemRemoved', instance.nodeRemoved)
+
+        instance._animLayers.addCallback('itemAdded', instance.animLayerAdded)
+        instance._animLayers.addCallback('itemRemoved', instance.animLayerRemoved)
+
+        # Copy nodes
+        #
+        instance._nodes.extend([copy(node) for node in self._nodes])
+
+        return instance
     # endregion
 
     # region Properties
@@ -159,6 +207,9 @@ class Pose(melsonobject.MELSONObject):
         """
 
         self._nodes.clear()
+        self._nodesByName.clear()
+        self._nodesByNameLower.clear()
+
         self._nodes.extend(nodes)
 
     @property
@@ -195,6 +246,7 @@ class Pose(melsonobject.MELSONObject):
         """
 
         node._pose = self.weakReference()
+        self.registerNodeName(node, node.name)
 
     def nodeRemoved(self, node):
         """
@@ -205,6 +257,7 @@ class Pose(melsonobject.MELSONObject):
         """
 
         node._pose = self.nullWeakReference
+        self.unregisterNodeName(node, node.name)
 
     def animLayerAdded(self, index, animLayer):
         """
@@ -229,6 +282,39 @@ class Pose(melsonobject.MELSONObject):
     # endregion
 
     # region Methods
+    def registerNodeName(self, node, name):
+        """
+        Adds the supplied node to the name lookups under the specified name.
+
+        :type node: PoseNode
+        :type name: str
+        :rtype: None
+        """
+
+        self._nodesByName.setdefault(name, []).append(node)
+        self._nodesByNameLower.setdefault(name.lower(), []).append(node)
+
+    def unregisterNodeName(self, node, name):
+        """
+        Removes the supplied node from the name lookups under the specified name.
+
+        :type node: PoseNode
+        :type name: str
+        :rtype: None
+        """
+
+        for (lookup, key) in ((self._nodesByName, name), (self._nodesByNameLower, name.lower())):
+
+            found = [other for other in lookup.get(key, []) if other is not node]
+
+            if len(found) > 0:
+
+                lookup[key] = found
+
+            else:
+
+                lookup.pop(key, None)
+
     def getAssociatedNodes(self, namespace=None):
         """
         Returns the nodes associated with this pose.
@@ -237,10 +323,22 @@ class Pose(melsonobject.MELSONObject):
         :rtype: List[mpynode.MPyNode]
         """
 
-        nodes = [node.getAssociatedNode(namespace=namespace) for node in self.nodes]
-        filteredNodes = list(filter(lambda node: node is not None, nodes))
+        # Evaluate absolute names
+        #
+        if namespace is None:
+
+            absoluteNames = [f'{node.namespace}:{node.name}' for node in self.nodes]
 
-        return filteredNodes
+        else:
+
+            prefix = f'{namespace}:'
+            absoluteNames = [prefix + node.name for node in self.nodes]
+
+        # Collect existing nodes
+        #
+        scene = self.scene
+
+        return [scene(absoluteName) for absoluteName in absoluteNames if scene.doesNodeExist(absoluteName)]
 
     def selectAssociatedNodes(self, namespace=None):
         """
@@ -269,11 +367,11 @@ class Pose(melsonobject.MELSONObject):
 
         if ignoreCase:
 
-            found = [pose for pose in self.nodes if pose.name.lower() == name.lower()]
+            found = self._nodesByNameLower.get(name.lower(), ())
 
         else:
 
-            found = [pose for pose in self.nodes if pose.name == name]
+            found = self._nodesByName.get(name, ())
 
         # Inspect collected poses
         #
@@ -333,12 +431,19 @@ class Pose(melsonobject.MELSONObject):
 
     def getKeyframeInputs(self):
         """
-        Returns the keyframe inputs from this pose.
+        Returns the sorted keyframe inputs from this pose.
 
         :rtype: List[int]
         """
 
-        return list(set(chain(*[node.getKeyframeInputs() for node in self.nodes])))
+        inputs = set()
+        update = inputs.update
+
+        for node in self.nodes:
+
+            update(node.getKeyframeInputs())
+
+        return sorted(inputs)
 
     def getKeyframeRange(self):
         """
@@ -347,7 +452,7 @@ class Pose(melsonobject.MELSONObject):
         :rtype: Tuple[int, int]
         """
 
-        inputs = list(sorted(self.getKeyframeInputs()))
+        inputs = self.getKeyframeInputs()
         numInputs = len(inputs)
 
         if numInputs == 0:
@@ -460,12 +565,13 @@ class Pose(melsonobject.MELSONObject):
         # Iterate through nodes
         #
         worldMatrix = relativeTo.worldMatrix()
+        poseInverseMatrix = poseMatrix.inverse()
 
         for (node, pose) in self.iterAssociatedPoses(*nodes, **kwargs):
 
             # Calculate matrix based on offset matrix
             #
-            offsetMatrix = pose.worldMatrix * poseMatrix.inverse()
+            offsetMatrix = pose.worldMatrix * poseInverseMatrix
             relativeMatrix = offsetMatrix * worldMatrix
             matrix = relativeMatrix * node.parentInverseMatrix()
 
@@ -530,20 +636,14 @@ class Pose(melsonobject.MELSONObject):
 
                 # Get anim-curve inputs
                 #
-                animCurves = [node.findAnimCurve(plug) for plug in node.iterPlugs(channelBox=True, skipUserAttributes=True)]
-                inputs = dict.fromkeys(chain(*[animCurve.inputs() for animCurve in animCurves if animCurve is not None]), True)
+                animCurves = map(node.findAnimCurve, node.iterPlugs(channelBox=True, skipUserAttributes=True))
+                inputs = set().union(*(animCurve.inputs() for animCurve in animCurves if animCurve is not None))
 
-                # Iterate through time-range
+                # Iterate through inputs inside time-range
                 #
-                for (i, time) in enumerate(inclusiveRange(startTime, endTime, step)):
-
-                    # Check if input exists
-                    #
-                    hasInput = inputs.get(time, False)
-
-                    if not hasInput:
+                times = sorted(time for time in inputs if startTime <= time <= endTime and (time - startTime) % step == 0)
 
-                        continue
+                for time in times:
 
                     # Apply transform at time
                     #
@@ -554,9 +654,19 @@ class Pose(melsonobject.MELSONObject):
 
         else:
 
+            # Collect node-pose pairs and clear existing keys from the start frame
+            # This ensures any skipped channels hold their start frame values!
+            #
+            pairs = list(self.iterAssociatedPoses(*nodes, **kwargs))
+            self.scene.time = startTime
+
+            for (node, pose) in pairs:
+
+                node.clearKeys(animationRange=animationRange, skipUserAttributes=True)
+
             # Iterate through time-range
             #
-            for (i, time) in enumerate(inclusiveRange(startTime, endTime, step)):
+            for time in inclusiveRange(startTime, endTime, step):
 
                 # Go to next frame
                 #
@@ -564,20 +674,12 @@ class Pose(melsonobject.MELSONObject):
 
                 # Iterate through nodes
                 #
-                for (node, pose) in self.iterAssociatedPoses(*nodes, **kwargs):
-
-                    # Check if keys should be cleared
-                    #
-                    if i == 0:
-
-                        node.clearKeys(animationRange=animationRange, skipUserAttributes=True)
+                for (node, pose) in pairs:
 
                     # Apply transform at time
                     #
                     worldMatrix = pose.getTransformation(time)
-                    matrix = worldMatrix * node.parentInverseMatrix()
-
-                    node.setMatrix(matrix, skipTranslate=skipTranslate, skipRotate=skipRotate, skipScale=skipScale)
+                    node.setWorldMatrix(worldMatrix, skipTranslate=skipTranslate, skipRotate=skipRotate, skipScale=skipScale)
 
     def applyAnimationRange(self):
         """
@@ -667,7 +769,10 @@ class PoseNode(melsonobject.MELSONObject):
         '_attributes',
         '_matrix',
         '_worldMatrix',
-        '_transformations'
+        '_transformations',
+        '_sortedTimes',
+        '_interpolations',
+        '_attributesByName'
     )
 
     def __init__(self, *args, **kwargs):
@@ -688,10 +793,43 @@ class PoseNode(melsonobject.MELSONObject):
         self._namespace = ''
         self._uuid = ''
         self._path = ''
-        self._attributes = []
+        self._attributes = ()
         self._matrix = om.MMatrix.kIdentity
         self._worldMatrix = om.MMatrix.kIdentity
         self._transformations = {}
+        self._sortedTimes = None
+        self._interpolations = {}
+        self._attributesByName = None
+
+    def __copy__(self):
+        """
+        Private method that returns a copy of this pose node.
+        The copy is not associated with any pose until it is added to one!
+
+        :rtype: PoseNode
+        """
+
+        # Copy slots onto new instance
+        #
+        cls = self.__class__
+        instance = cls.__new__(cls)
+
+        for base in cls.__mro__:
+
+            for name in base.__dict__.get('__slots__', ()):
+
+                if name not in ('__weakref__', '__dict__') and hasattr(self, name):
+
+                    setattr(instance, name, getattr(self, name))
+
+        # Detach copy from pose and copy attributes
+        # The remaining containers are only ever rebound so they are safe to share
+        #
+        instance._pose = self.nullWeakReference
+        instance._attributes = tuple(copy(attribute) for attribute in self._attributes)
+        instance._attributesByName = None
+
+        return instance
     # endregion
 
     # region Properties
@@ -734,7 +872,19 @@ class PoseNode(melsonobject.MELSONObject):
         :rtype: None
         """
 
-        self._name = name
+        # Intern name before updating pose lookups
+        #
+        oldName = self._name
+        self._name = sys.intern(name) if isinstance(name, str) else name
+
+        # Check if pose lookups require updating
+        #
+        pose = self._pose()
+
+        if pose is not None:
+
+            pose.unregisterNodeName(self, oldName)
+            pose.registerNodeName(self, self._name)
 
     @property
     def namespace(self):
@@ -755,7 +905,7 @@ class PoseNode(melsonobject.MELSONObject):
         :rtype: None
         """
 
-        self._namespace = namespace
+        self._namespace = sys.intern(namespace) if isinstance(namespace, str) else namespace
 
     @property
     def uuid(self):
@@ -803,8 +953,9 @@ class PoseNode(melsonobject.MELSONObject):
     def attributes(self):
         """
         Getter method that returns the attributes from this node.
+        A tuple is returned so the attribute name index cannot go stale, use the setter to make changes!
 
-        :rtype: List[PoseAttribute]
+        :rtype: Tuple[PoseAttribute]
         """
 
         return self._attributes
@@ -818,8 +969,8 @@ class PoseNode(melsonobject.MELSONObject):
         :rtype: None
         """
 
-        self._attributes.clear()
-        self._attributes.extend(attributes)
+        self._attributes = tuple(attributes)
+        self._attributesByName = None
 
     @property
     def matrix(self):
@@ -840,7 +991,7 @@ class PoseNode(melsonobject.MELSONObject):
         :rtype: None
         """
 
-        self._matrix = om.MMatrix(matrix)
+        self._matrix = matrix if type(matrix) is om.MMatrix else om.MMatrix(matrix)
 
     @property
     def worldMatrix(self):
@@ -861,17 +1012,18 @@ class PoseNode(melsonobject.MELSONObject):
         :rtype: None
         """
 
-        self._worldMatrix = om.MMatrix(worldMatrix)
+        self._worldMatrix = worldMatrix if type(worldMatrix) is om.MMatrix else om.MMatrix(worldMatrix)
 
     @property
     def transformations(self):
         """
         Getter method that returns the transformations for this pose node.
+        A copy is returned so the cached interpolations cannot go stale, use the setter to make changes!
 
         :rtype: Dict[int, om.MMatrix]
         """
 
-        return self._transformations
+        return dict(self._transformations)
 
     @transformations.setter
     def transformations(self, transformations):
@@ -882,8 +1034,11 @@ class PoseNode(melsonobject.MELSONObject):
         :rtype: None
         """
 
-        self._transformations.clear()
-        self._transformations.update({stringutils.eval(key): value for (key, value) in transformations.items()})
+        transformations = {stringutils.eval(key): value for (key, value) in transformations.items()}
+
+        self._transformations = transformations
+        self._sortedTimes = None
+        self._interpolations = {}
     # endregion
 
     # region Methods
@@ -914,25 +1069,27 @@ class PoseNode(melsonobject.MELSONObject):
         :rtype: Union[PoseAttribute, None]
         """
 
-        found = [attribute for attribute in self.attributes if attribute.name == name]
-        numFound = len(found)
-
-        if numFound == 1:
+        if self._attributesByName is None:
 
-            return found[0]
+            self._attributesByName = {attribute.name: attribute for attribute in self._attributes}
 
-        else:
-
-            return None
+        return self._attributesByName.get(name, None)
 
     def getKeyframeInputs(self):
         """
-        Returns the keyframe inputs from this node.
+        Returns the sorted keyframe inputs from this node.
 
         :rtype: List[int]
         """
 
-        return list(set(chain(*[attribute.getKeyframeInputs() for attribute in self.attributes])))
+        inputs = set()
+        update = inputs.update
+
+        for attribute in self.attributes:
+
+            update(attribute.keyTimes)
+
+        return sorted(inputs)
 
     def getKeyframeRange(self):
         """
@@ -941,7 +1098,7 @@ class PoseNode(melsonobject.MELSONObject):
         :rtype: Tuple[int, int]
         """
 
-        inputs = list(sorted(self.getKeyframeInputs()))
+        inputs = self.getKeyframeInputs()
         numInputs = len(inputs)
 
         if numInputs == 0:
@@ -966,15 +1123,19 @@ class PoseNode(melsonobject.MELSONObject):
 
         # Check if transformation exists
         #
-        matrix = self.transformations.get(time, None)
+        matrix = self._transformations.get(time, None)
 
         if matrix is not None:
 
             return matrix
 
-        # Get time inputs
+        # Get sorted time inputs
         #
-        times = list(self.transformations.keys())
+        if self._sortedTimes is None:
+
+            self._sortedTimes = sorted(self._transformations.keys())
+
+        times = self._sortedTimes
         numTimes = len(times)
 
         if numTimes == 0:
@@ -987,18 +1148,32 @@ class PoseNode(melsonobject.MELSONObject):
 
         if firstTime < time < lastTime:
 
-            startTime, endTime = [(times[i], times[i + 1]) for i in range(numTimes - 1) if times[i] <= time <= times[i + 1]][0]
+            # Check if interpolation has already been cached
+            #
+            matrix = self._interpolations.get(time, None)
+
+            if matrix is not None:
+
+                return matrix
+
+            # Interpolate between surrounding transformations
+            #
+            index = bisect_right(times, time) - 1
+            startTime, endTime = times[index], times[index + 1]
             weight = (time - startTime) / (endTime - startTime)
 
-            return transformutils.lerpMatrix(self.transformations[startTime], self.transformations[endTime], weight)
+            matrix = transformutils.lerpMatrix(self._transformations[startTime], self._transformations[endTime], weight)
+            self._interpolations[time] = matrix
+
+            return matrix
 
         elif time <= firstTime:
 
-            return self.transformations[firstTime]
+            return self._transformations[firstTime]
 
         elif time >= lastTime:
 
-            return self.transformations[lastTime]
+            return self._transformations[lastTime]
 
         else:
 
@@ -1044,6 +1219,7 @@ class PoseNode(melsonobject.MELSONObject):
         insertAt = kwargs.get('insertAt', None)
         animationRange = kwargs.get('animationRange', self.pose.animationRange)
         skipUserAttributes = kwargs.get('skipUserAttributes', False)
+        difference = (insertAt - self.pose.animationRange[0]) if insertAt is not None else 0
 
         for attribute in self.attributes:
 
@@ -1094,14 +1270,13 @@ class PoseNode(melsonobject.MELSONObject):
 
             if insertAt is not None:
 
-                difference = insertAt - self.pose.animationRange[0]
                 keyframes = [key.copy(time=(key.time + difference)) for key in attribute.keyframes]
                 
                 animCurve.replaceKeys(keyframes, animationRange=animationRange)
 
             else:
 
-                animCurve.replaceKeys(attribute.keyframes, animationRange=animationRange)
+                animCurve.replaceKeys(list(attribute.keyframes), animationRange=animationRange)
 
     def applyMatrix(self, node, **kwargs):
         """
@@ -1121,8 +1296,7 @@ class PoseNode(melsonobject.MELSONObject):
         :rtype: None
         """
 
-        matrix = self.worldMatrix * node.parentInverseMatrix()
-        node.setMatrix(matrix, **kwargs)
+        node.setWorldMatrix(self.worldMatrix, **kwargs)
 
     def mirrorValues(self, node, **kwargs):
         """
@@ -1135,6 +1309,8 @@ class PoseNode(melsonobject.MELSONObject):
         # Iterate through attributes
         #
         otherNode = node.getOppositeNode()
+        nodeName = node.name()
+        userProperties = node.userProperties
 
         for attribute in self.attributes:
 
@@ -1142,13 +1318,12 @@ class PoseNode(melsonobject.MELSONObject):
             #
             if not otherNode.hasAttr(attribute.name):
 
-                log.warning(f'Cannot locate "{attribute.name}" attribute on "{node.name()}" node!')
+                log.warning(f'Cannot locate "{attribute.name}" attribute on "{nodeName}" node!')
                 continue
 
             # Mirror attribute to other node
             #
-            mirrorFlag = 'mirror{name}'.format(name=stringutils.titleize(attribute.name))
-            mirrorEnabled = node.userProperties.get(mirrorFlag, False)
+            mirrorEnabled = userProperties.get(attribute.mirrorFlag, False)
 
             if mirrorEnabled:
 
@@ -1171,6 +1346,8 @@ class PoseNode(melsonobject.MELSONObject):
         # Iterate through attributes
         #
         otherNode = node.getOppositeNode()
+        nodeName = node.name()
+        userProperties = node.userProperties
 
         insertAt = kwargs.get('insertAt', None)
         animationRange = kwargs.get('animationRange', self.pose.animationRange)
@@ -1188,7 +1365,7 @@ class PoseNode(melsonobject.MELSONObject):
             #
             if not otherNode.hasAttr(attribute.name):
 
-                log.warning(f'Cannot locate "{attribute.name}" attribute from "{node.name()}" node!')
+                log.warning(f'Cannot locate "{attribute.name}" attribute from "{nodeName}" node!')
                 continue
 
             # Check if user attributes should be skipped
@@ -1197,13 +1374,12 @@ class PoseNode(melsonobject.MELSONObject):
 
             if skipUserAttributes and plug.isDynamic:
 
-                log.debug(f'Skipping "{attribute.name}" user attribute on "{node.name()}" node!')
+                log.debug(f'Skipping "{attribute.name}" user attribute on "{nodeName}" node!')
                 continue
 
             # Check if keyframes need to be inversed
             #
-            mirrorFlag = 'mirror{name}'.format(name=stringutils.titleize(attribute.name))
-            mirrorEnabled = node.userProperties.get(mirrorFlag, False)
+            mirrorEnabled = userProperties.get(attribute.mirrorFlag, False)
 
             startTime, endTime = animationRange
             keyframes = attribute.getRange(startTime, endTime, invert=mirrorEnabled)
@@ -1232,19 +1408,21 @@ class PoseNode(melsonobject.MELSONObject):
 
         # Create new pose node
         #
+        skipKeys = kwargs.get('skipKeys', True)
+        keyRange = kwargs.get('animationRange', None)
+
         instance = cls(
             name=node.name(),
             namespace=node.namespace(),
             uuid=node.uuid(asString=True),
             path=node.dagPath().fullPathName(),
-            attributes=[PoseAttribute.create(plug, **kwargs) for plug in node.iterPlugs(channelBox=True)],
+            attributes=[PoseAttribute.create(plug, node=node, skipKeys=skipKeys, animationRange=keyRange) for plug in node.iterPlugs(channelBox=True)],
             matrix=node.matrix(),
             worldMatrix=node.worldMatrix()
         )
 
         # Check if transformations should be cached
         #
-        skipKeys = kwargs.get('skipKeys', True)
         skipTransformations = kwargs.get('skipTransformations', True)
 
         transformations = {}
@@ -1278,7 +1456,9 @@ class PoseAttribute(melsonobject.MELSONObject):
         '_preInfinityType',
         '_postInfinityType',
         '_weighted',
-        '_keyframes'
+        '_keyframes',
+        '_keyTimes',
+        '_mirrorFlag'
     )
 
     def __init__(self, *args, **kwargs):
@@ -1299,7 +1479,32 @@ class PoseAttribute(melsonobject.MELSONObject):
         self._preInfinityType = 0
         self._postInfinityType = 0
         self._weighted = False
-        self._keyframes = []
+        self._keyframes = ()
+        self._keyTimes = ()
+        self._mirrorFlag = ''
+
+    def __copy__(self):
+        """
+        Private method that returns a copy of this pose attribute.
+        The keyframes are stored as tuples so they are shared rather than copied.
+
+        :rtype: PoseAttribute
+        """
+
+        # Copy slots onto new instance
+        #
+        cls = self.__class__
+        instance = cls.__new__(cls)
+
+        for base in cls.__mro__:
+
+            for name in base.__dict__.get('__slots__', ()):
+
+                if name not in ('__weakref__', '__dict__') and hasattr(self, name):
+
+                    setattr(instance, name, getattr(self, name))
+
+        return instance
     # endregion
 
     # region Properties
@@ -1322,7 +1527,25 @@ class PoseAttribute(melsonobject.MELSONObject):
         :rtype: None
         """
 
-        self._name = name
+        if isinstance(name, str):
+
+            self._name = sys.intern(name)
+            self._mirrorFlag = 'mirror{name}'.format(name=stringutils.titleize(name))
+
+        else:
+
+            self._name = name
+            self._mirrorFlag = ''
+
+    @property
+    def mirrorFlag(self):
+        """
+        Getter method that returns the user property name that toggles mirroring for this plug.
+
+        :rtype: str
+        """
+
+        return self._mirrorFlag
 
     @property
     def value(self):
@@ -1412,8 +1635,9 @@ class PoseAttribute(melsonobject.MELSONObject):
     def keyframes(self):
         """
         Getter method that returns the keyframes for this animation curve.
+        A tuple is returned so the cached key times cannot go stale, use the setter to make changes!
 
-        :rtype: List[keyframe.Keyframe]
+        :rtype: Tuple[keyframe.Keyframe]
         """
 
         return self._keyframes
@@ -1427,8 +1651,18 @@ class PoseAttribute(melsonobject.MELSONObject):
         :rtype: None
         """
 
-        self._keyframes.clear()
-        self._keyframes.extend(keyframes)
+        self._keyframes = tuple(sorted(keyframes, key=attrgetter('time')))
+        self._keyTimes = tuple(key.time for key in self._keyframes)
+
+    @property
+    def keyTimes(self):
+        """
+        Getter method that returns the sorted keyframe times for this animation curve.
+
+        :rtype: Tuple[Union[int, float]]
+        """
+
+        return self._keyTimes
     # endregion
 
     # region Methods
@@ -1439,7 +1673,7 @@ class PoseAttribute(melsonobject.MELSONObject):
         :rtype: List[float]
         """
 
-        return list({keyframe.time for keyframe in self.keyframes})
+        return list(dict.fromkeys(self._keyTimes))
 
     def getRange(self, startTime, endTime, invert=False):
         """
@@ -1451,22 +1685,28 @@ class PoseAttribute(melsonobject.MELSONObject):
         :rtype: List[keyframe.Keyframe]
         """
 
-        keyframes = [key for key in self.keyframes if startTime <= key.time <= endTime]
+        lower = bisect_left(self._keyTimes, startTime)
+        upper = bisect_right(self._keyTimes, endTime, lo=lower)
+        keyframes = self._keyframes[lower:upper]
 
         if invert:
 
-            return list(map(neg, keyframes))
+            return [-key for key in keyframes]
 
         else:
 
-            return keyframes
+            return list(keyframes)
 
     @classmethod
-    def create(cls, plug, **kwargs):
+    def create(cls, plug, node=None, skipKeys=True, animationRange=None, **kwargs):
         """
         Returns a new pose attribute using the supplied plug.
+        If the plug's node has already been wrapped it can be supplied to skip rewrapping it!
 
         :type plug: om.MPlug
+        :type node: Union[mpynode.MPyNode, None]
+        :type skipKeys: bool
+        :type animationRange: Union[Tuple[int, int], None]
         :rtype: PoseAttribute
         """
 
@@ -1477,16 +1717,18 @@ class PoseAttribute(melsonobject.MELSONObject):
         weighted = False
         keyframes = []
 
-        node = mpynode.MPyNode(plug.node())
-        animCurve = node.findAnimCurve(plug)
-        skipKeys = kwargs.get('skipKeys', True)
+        animCurve = None
+
+        if not skipKeys:
 
-        if animCurve is not None and not skipKeys:
+            node = mpynode.MPyNode(plug.node()) if node is None else node
+            animCurve = node.findAnimCurve(plug)
+
+        if animCurve is not None:
 
             preInfinityType = animCurve.preInfinity
             postInfinityType = animCurve.postInfinity
             weighted = animCurve.isWeighted
-            animationRange = kwargs.get('animationRange', None)
             keyframes = animCurve.getKeys(animationRange=animationRange)
 
         # Return new pose attribute
@@ -1763,7 +2005,8 @@ class PoseAnimLayer(melsonobject.MELSONObject):
         '_passthrough',
         '_weight',
         '_rotationAccumulationMode',
-        '_scaleAccumulationMode'
+        '_scaleAccumulationMode',
+        '_weakReference'
     )
 
     def __init__(self, *args, **kwargs):
@@ -1794,6 +2037,7 @@ class PoseAnimLayer(melsonobject.MELSONObject):
         self._weight = 1.0
         self._rotationAccumulationMode = 0
         self._scaleAccumulationMode = 1
+        self._weakReference = self.weakReference()
 
         # Initialize notifies
         #
@@ -2101,7 +2345,7 @@ class PoseAnimLayer(melsonobject.MELSONObject):
         :rtype: None
         """
 
-        layer._parent = self.weakReference()
+        layer._parent = self._weakReference
 
     def layerRemoved(self, layer):
         """
@@ -2122,7 +2366,7 @@ class PoseAnimLayer(melsonobject.MELSONObject):
         :rtype: None
         """
 
-        member._animLayer = self.weakReference()
+        member._animLayer = self._weakReference
 
     def memberRemoved(self, member):
         """
@@ -2146,6 +2390,28 @@ class PoseAnimLayer(melsonobject.MELSONObject):
         :rtype: PoseAnimLayer
         """
 
+        # Group node handles by hash code for membership tests
+        #
+        handles = {}
+
+        for node in (nodes if nodes is not None else ()):
+
+            handle = om.MObjectHandle(node.object())
+            handles.setdefault(handle.hashCode(), []).append(handle)
+
+        return cls._create(layer, handles)
+
+    @classmethod
+    def _create(cls, layer, handles):
+        """
+        Private method that returns a new pose layer using the supplied layer.
+        Members whose node matches one of the supplied handles are skipped!
+
+        :type layer: mpynode.MPyNode
+        :type handles: Dict[int, List[om.MObjectHandle]]
+        :rtype: PoseAnimLayer
+        """
+
         # Create new layer
         #
         instance = cls(
@@ -2165,14 +2431,17 @@ class PoseAnimLayer(melsonobject.MELSONObject):
         # Iterate through members
         #
         plugs = layer.members()
+        members = []
 
         for plug in plugs:
 
             # Check if member is in nodes
+            # Hash codes can collide so each hit is confirmed by handle equality
             #
-            node = plug.node()
+            handle = om.MObjectHandle(plug.node())
+            candidates = handles.get(handle.hashCode(), ())
 
-            if node in nodes:
+            if any(candidate == handle for candidate in candidates):
 
                 continue
 
@@ -2181,16 +2450,17 @@ class PoseAnimLayer(melsonobject.MELSONObject):
             animCurve = layer.getAssociatedAnimCurve(plug)
 
             member = PoseMember.create(plug, animCurve)
-            instance.members.append(member)
+            members.append(member)
+
+        instance.members = members
 
         # Check if layer has any children
         #
         children = layer.children()
-        numChildren = len(children)
 
-        if numChildren > 0:
+        if children:
 
-            instance.children = [cls.create(child, nodes=nodes) for child in children]
+            instance.children = [cls._create(child, handles) for child in children]
 
         return instance
     # endregion
@@ -58,14 +58,18 @@ def exportPose(filePath, pose, **kwargs):
 
     :type filePath: str
     :type pose: Pose
-    :key skipKeys: bool
-    :key skipLayers: bool
-    :key skipTransformations: bool
+    :key indent: Union[int, None]
     :rtype: None
     """
 
+    # Evaluate output formatting
+    # Compact separators skip the per-item whitespace writes when indentation is disabled
+    #
+    indent = kwargs.get('indent', 4)
+    separators = (',', ':') if indent is None else None
+
     log.info('Exporting pose to: %s' % filePath)
-    jsonutils.dump(filePath, pose, cls=MDataEncoder, indent=4)
+    jsonutils.dump(filePath, pose, cls=MDataEncoder, indent=indent, separators=separators)
 
 
 def exportPoseFromNodes(filePath, nodes, **kwargs):
@@ -77,11 +81,14 @@ def exportPoseFromNodes(filePath, nodes, **kwargs):
     :key skipKeys: bool
     :key skipLayers: bool
     :key skipTransformations: bool
+    :key indent: Union[int, None]
     :rtype: None
     """
 
+    indent = kwargs.pop('indent', 4)
+
     pose = createPose(*nodes, **kwargs)
-    exportPose(filePath, pose)
+    exportPose(filePath, pose, indent=indent)
 
 
 def importPose(filePath):
@@ -110,19 +117,19 @@ def importPoseRange(filePath):
 
     with open(filePath, 'r') as jsonFile:
 
-        string = ''.join(jsonFile.readlines())
+        string = jsonFile.read()
 
-    # Find all animation-range keys
+    # Find first animation-range key
     #
-    groups = __animation_range__.findall(string)
+    match = __animation_range__.search(string)
 
-    if len(groups) != 1:
+    if match is None:
 
         return None
 
     # Check if group is valid
     #
-    startTime, endTime = groups[0]
+    startTime, endTime = match.groups()
 
     if not (stringutils.isNullOrEmpty(startTime) or stringutils.isNullOrEmpty(endTime)):
 
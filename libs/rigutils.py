@@ -23,13 +23,8 @@ def loadConfigurations():
 
     # Iterate through configuration files
     #
-    filePaths = [os.path.join(directory, filename) for filename in os.listdir(directory) if filename.endswith('.config')]
-    numFilePaths = len(filePaths)
+    with os.scandir(directory) as entries:
 
-    configs = [None] * numFilePaths
+        filePaths = [entry.path for entry in entries if entry.name.endswith('.config') and entry.is_file()]
 
-    for (i, filePath) in enumerate(filePaths):
-
-        configs[i] = jsonutils.load(filePath)
-
-    return configs
+    return [jsonutils.load(filePath) for filePath in filePaths]
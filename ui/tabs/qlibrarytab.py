@@ -923,7 +923,8 @@ class QLibraryTab(qabstracttab.QAbstractTab):
             name=name,
             animationRange=animationRange,
             skipKeys=False,
-            skipLayers=True
+            skipLayers=True,
+            indent=4
         )
 
         # Refresh file view
@@ -1032,7 +1033,8 @@ class QLibraryTab(qabstracttab.QAbstractTab):
                 self.getSelection(),
                 skipKeys=False,
                 skipLayers=True,
-                animationRange=animationRange
+                animationRange=animationRange,
+                indent=4
             )
 
         else:
@@ -1345,7 +1347,7 @@ class QLibraryTab(qabstracttab.QAbstractTab):
 
         absolutePath = os.path.join(self.cwd(), text)
 
-        if os.path.isdir(absolutePath) and os.path.exists(absolutePath):
+        if os.path.isdir(absolutePath):
 
             self._currentPath = text
             self.fileItemModel.setCwd(absolutePath)
@@ -1363,7 +1365,7 @@ class QLibraryTab(qabstracttab.QAbstractTab):
 
         absolutePath = os.path.join(self.cwd(), text)
 
-        if not os.path.isdir(absolutePath) or not os.path.exists(absolutePath):
+        if not os.path.isdir(absolutePath):
 
             lineEdit.setText(self._currentPath)
 